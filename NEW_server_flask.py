@@ -1,6 +1,13 @@
 #this is the motor server
 #!/usr/bin/env python3
-from flask import Flask, request, jsonify
+# I2C SPEED: The PCA9685 supports 400kHz Fast Mode but the Pi defaults to 100kHz.
+# Add this line to /boot/config.txt and reboot:
+#     dtparam=i2c_arm_baudrate=400000
+# The server prints a warning at startup if the bus is still slower than that.
+from quart import Quart, request, Response
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+import orjson
 from board import SCL, SDA
 import busio
 from adafruit_pca9685 import PCA9685
@@ -9,12 +16,8 @@ import signal
 import sys
 import time
 import os
-import threading # Import threading module
-import logging
-
-# Set up logging to avoid Flask/Werkzeug noise
-log = logging.getLogger('werkzeug')
-log.setLevel(logging.ERROR)
+import asyncio # Ramps run as tasks on the server's event loop
+from array import array
 
 # --------------------------
 # PCA9685 Setup
@@ -24,12 +27,32 @@ log.setLevel(logging.ERROR)
 # or if the board jumpers (A0-A5) are modified, this address must be updated.
 PCA9685_ADDRESS = 0x40 
 
+# I2C Fast Mode (see header comment) and where the Pi exposes the active bus speed
+I2C_FAST_MODE_HZ = 400000
+I2C_CLOCK_FREQ_PATH = "/sys/class/i2c-adapter/i2c-1/of_node/clock-frequency"
+
+def check_i2c_baudrate():
+    """Warns if the Pi's I2C bus is not running at 400kHz Fast Mode."""
+    try:
+        with open(I2C_CLOCK_FREQ_PATH, "rb") as f:
+            # Device-tree property: a single big-endian 32-bit integer
+            freq = int.from_bytes(f.read(4), "big")
+    except OSError:
+        print("Warning: Could not read I2C bus frequency (non-Pi environment?).")
+        return
+    if freq < I2C_FAST_MODE_HZ:
+        print(f"Warning: I2C bus is at {freq // 1000}kHz. Add 'dtparam=i2c_arm_baudrate=400000' to /boot/config.txt and reboot.")
+    else:
+        print(f"I2C bus running at {freq // 1000}kHz.")
+
+check_i2c_baudrate()
+
 # NOTE on I2C: The I2C pins are correctly initialized using the board module's 
 # SCL and SDA constants. If I2C communication fails, please check the physical 
 # wiring, including I2C pull-up resistors and the PCA9685's address jumpers.
 try:
     # Initialize I2C and PCA9685
-    i2c = busio.I2C(SCL, SDA)
+    i2c = busio.I2C(SCL, SDA, frequency=I2C_FAST_MODE_HZ)
     # Explicitly pass the I2C address for configurability
     pca = PCA9685(i2c, address=PCA9685_ADDRESS) 
     pca.frequency = 50 # Standard 50Hz for servo/ESC control
@@ -47,6 +70,17 @@ motor_channels = {
     "4": 15
 }
 
+# PCA9685 register map: each channel owns 4 consecutive LED registers
+# (ON_L, ON_H, OFF_L, OFF_H) starting at LED0_ON_L = 0x06.
+LED0_ON_L = 0x06
+# Precomputed LED register base for each motor channel
+led_base_regs = {ch: LED0_ON_L + 4 * ch for ch in motor_channels.values()}
+# ALL_LED_ON_L..ALL_LED_OFF_H (0xFA-0xFD) write the same value to every channel at once.
+# NOTE: This also drives channels 0-11, which are unused on this board.
+ALL_LED_ON_L = 0xFA
+# Last duty cycle written to each of the 16 PCA channels (None = not written yet)
+last_duty = [None] * 16
+
 # --- CALIBRATED CONSTANTS ---
 # UPDATED based on user feedback: The ESCs arm/beep when set to 120.
 # ARMING_ANGLE and NEUTRAL_ANGLE are now identical to perform the
@@ -58,8 +92,11 @@ REVERSE_ANGLE = 60  # <-- NEW: Assumes 60° gives max reverse. Common value for
 
 # State dictionary to track the current angle for each motor
 motor_states = {m: NEUTRAL_ANGLE for m in motor_channels.keys()}
-# Lock to ensure thread-safe access to motor_states
-motor_state_lock = threading.Lock() 
+# One lock per motor so a ramp on one motor never waits on another motor's state updates
+motor_state_locks = {m: asyncio.Lock() for m in motor_channels.keys()}
+# The single in-flight ramp task for each motor (also keeps a strong reference,
+# since the event loop only holds weak ones)
+motor_tasks = {}
 
 # --------------------------
 # PWM Helper 
@@ -73,9 +110,39 @@ def angle_to_pwm(angle):
     duty = int((pulse_us / 20000.0) * 65535)
     return duty
 
+# Precomputed duty cycle for every whole angle (0-180) so the ramp loop
+# does a single index instead of float math on each PWM write.
+ANGLE_TO_DUTY = array('H', [angle_to_pwm(a) for a in range(181)])
+
 # --------------------------
 # Utility Functions
 # --------------------------
+def led_register_burst(start_reg, duty):
+    """Builds the register address + ON_L, ON_H, OFF_L, OFF_H bytes for a 16-bit duty cycle."""
+    # Same 16-bit -> 12-bit conversion the adafruit_pca9685 driver uses
+    if duty >= 0xFFFF:
+        on, off = 0x1000, 0 # Full-on bit
+    else:
+        on, off = 0, (duty + 1) >> 4
+    return bytes((start_reg, on & 0xFF, on >> 8, off & 0xFF, off >> 8))
+
+def set_duty_cycle_raw(channel, duty):
+    """Writes a 16-bit duty cycle to a PCA channel as a single I2C transaction."""
+    # Register address + 4 LED registers (auto-increment) in one burst
+    buf = led_register_burst(led_base_regs[channel], duty)
+    with pca.i2c_device as device:
+        device.write(buf)
+    last_duty[channel] = duty
+
+def set_all_duty_raw(duty):
+    """Writes the same 16-bit duty cycle to every PCA channel in one I2C transaction."""
+    # All channels switch on the same PWM cycle, so the motors change together
+    buf = led_register_burst(ALL_LED_ON_L, duty)
+    with pca.i2c_device as device:
+        device.write(buf)
+    for ch in range(len(last_duty)):
+        last_duty[ch] = duty
+
 def set_duty_cycle(channel, angle):
     """Sets the duty cycle for a specific PCA channel based on angle."""
     if pca is None:
@@ -83,9 +150,12 @@ def set_duty_cycle(channel, angle):
         print(f"SIMULATION: Setting Ch {channel} to {angle}°")
         return
         
-    duty = angle_to_pwm(angle)
+    duty = ANGLE_TO_DUTY[int(round(angle))]
+    # Skip the I2C write if the channel is already outputting this duty cycle
+    if last_duty[channel] == duty:
+        return
     try:
-        pca.channels[channel].duty_cycle = duty
+        set_duty_cycle_raw(channel, duty)
     except Exception as e:
         print(f"Error setting PWM on channel {channel}: {e}")
 
@@ -95,15 +165,12 @@ def initialize_escs():
         print("SIMULATION: ESC initialization skipped due to hardware error.")
         return
 
-    channels_to_init = list(motor_channels.values())
-    
     print("\n--- ESC Initialization Sequence (Arm at 120°) ---")
     
     # 1. Arming Pulse: Set all motors to the minimum safe pulse (120°). 
     # This pulse is what the ESC requires to arm/beep.
     print(f"STEP 1: Setting all motors to ARMING_ANGLE ({ARMING_ANGLE}°). ESCs should arm/beep now.")
-    for ch in channels_to_init:
-        set_duty_cycle(ch, ARMING_ANGLE)
+    set_all_duty_raw(ANGLE_TO_DUTY[ARMING_ANGLE])
     
     # Hold for a few seconds to let ESCs recognize the signal and arm.
     time.sleep(3.0) 
@@ -111,74 +178,26 @@ def initialize_escs():
     # 2. Safety Check: Move to 0 duty cycle (minimum electrical signal) to ensure ESCs 
     # are ready to receive commands from a true safety stop.
     print("STEP 2: Safety Minimum (0 duty cycle) for 1 second.")
-    for ch in channels_to_init:
-        # Set to 0. This is the 0-pulse/disarm signal.
-        pca.channels[ch].duty_cycle = 0 
+    # Set to 0. This is the 0-pulse/disarm signal.
+    set_all_duty_raw(0)
     time.sleep(1.0)
     
     # 3. Neutral State: Move back to the confirmed 120° to complete arming and hold neutral.
     print(f"STEP 3: Moving to confirmed NEUTRAL_ANGLE ({NEUTRAL_ANGLE}°). Motors should be stopped and armed.")
-    for ch in channels_to_init:
-        set_duty_cycle(ch, NEUTRAL_ANGLE)
+    set_all_duty_raw(ANGLE_TO_DUTY[NEUTRAL_ANGLE])
     time.sleep(2.0)
     
     # Update all internal states to the NEUTRAL_ANGLE
-    with motor_state_lock:
-        for motor_num in motor_states.keys():
-            motor_states[motor_num] = NEUTRAL_ANGLE
+    # (runs before the event loop starts, so no ramp task can be holding the lock)
+    for motor_num in motor_states.keys():
+        motor_states[motor_num] = NEUTRAL_ANGLE
     
     print(f"ESCs initialized and armed at neutral ({NEUTRAL_ANGLE}°) - motors stopped.")
 
 # --------------------------
-# Motor Control 
-# --------------------------
-# --------------------------
-# Motor Control (SAFE VERSION)
-# --------------------------
-def set_motor_speed(motor_num, target_angle):
-    """Safely transitions motor speed, enforcing a stop for direction reversal."""
-    
-    if motor_num not in motor_channels:
-        print(f"ERROR: Invalid motor number: {motor_num}")
-        return
-
-    ch = motor_channels[motor_num]
-    
-    # 1. READ CURRENT STATE (Inside lock)
-    with motor_state_lock:
-        current_angle = motor_states[motor_num]
-    
-    # Check if we are already at the target
-    if current_angle == target_angle:
-        print(f"Motor {motor_num}: Already at target angle {target_angle}°")
-        return
-        
-    print(f"Motor {motor_num}: Changing speed/direction from {current_angle}° to {target_angle}°.")
-
-    # Clamp the target angle for safety
-    clamped_target = max(REVERSE_ANGLE, min(FORWARD_ANGLE, target_angle)) 
-    
-    # --- CRITICAL SAFETY BLOCK: Enforce Neutral Stop for Reversal ---
-    # Only perform the intermediate stop if the motor is currently running 
-    # and the target is not neutral (i.e., changing direction or running to a different speed)
-    if current_angle != NEUTRAL_ANGLE and clamped_target != NEUTRAL_ANGLE:
-        
-        print(f"Motor {motor_num}: Intermediate Stop ({NEUTRAL_ANGLE}°) for 0.1s to ensure safe reversal.")
-        
-        # Step A: STOP
-        set_duty_cycle(ch, NEUTRAL_ANGLE)
-        # Update state immediately (crucial for accurate tracking)
-        with motor_state_lock:
-            motor_states[motor_num] = NEUTRAL_ANGLE 
-            
-        # Step B: DELAY
-        time.sleep(0.1) # Wait 100ms for the ESC to register the neutral signal
-        
- # --------------------------
-# --------------------------
 # Motor Control (WITH RAMP-UP AND NAMEERROR FIX)
 # --------------------------
-def set_motor_speed(motor_num, target_angle):
+async def set_motor_speed(motor_num, target_angle):
     """Safely transitions motor speed, enforcing a stop for reversal AND implementing a soft start."""
     
     if motor_num not in motor_channels:
@@ -188,7 +207,7 @@ def set_motor_speed(motor_num, target_angle):
     ch = motor_channels[motor_num]
     
     # 1. READ CURRENT STATE (Inside lock) - FIX for NameError
-    with motor_state_lock:
+    async with motor_state_locks[motor_num]:
         # 'current_angle' is now guaranteed to be defined before any 'if' statement uses it
         current_angle = motor_states[motor_num]
     
@@ -212,11 +231,11 @@ def set_motor_speed(motor_num, target_angle):
         # Step A: STOP
         set_duty_cycle(ch, NEUTRAL_ANGLE)
         # Update state immediately (crucial for accurate tracking)
-        with motor_state_lock:
+        async with motor_state_locks[motor_num]:
             motor_states[motor_num] = NEUTRAL_ANGLE 
             
         # Step B: DELAY
-        time.sleep(0.1) # Wait 100ms for the ESC to register the neutral signal
+        await asyncio.sleep(0.1) # Wait 100ms for the ESC to register the neutral signal
         
         # Update current_angle to NEUTRAL_ANGLE for the subsequent ramp-up logic
         current_angle = NEUTRAL_ANGLE 
@@ -233,30 +252,20 @@ def set_motor_speed(motor_num, target_angle):
         print(f"Motor {motor_num}: Starting smooth speed transition to {clamped_target}°.")
         
         start_angle = NEUTRAL_ANGLE
-        # Calculate the required size of each step
-        step_size = (clamped_target - start_angle) / steps
-        
-        current_angle_in_ramp = start_angle
+        # Precompute the whole ramp as whole-degree angles. Integer division
+        # lands exactly on clamped_target at the last step, so no overshoot clamp is needed.
+        span = clamped_target - start_angle
+        ramp_angles = [start_angle + span * i // steps for i in range(1, steps + 1)]
         
         # Perform the ramp
-        for i in range(1, steps + 1):
-            
-            # Calculate the next angle
-            current_angle_in_ramp += step_size
-            
-            # Clamp to the final target to avoid overshoot
-            if step_size > 0: # Forward direction (from 120 up to 180)
-                next_angle = min(clamped_target, current_angle_in_ramp)
-            else: # Reverse direction (from 120 down to 60)
-                next_angle = max(clamped_target, current_angle_in_ramp)
-                
+        for next_angle in ramp_angles:
             set_duty_cycle(ch, next_angle)
             
             # Update state *during* the ramp for accurate tracking
-            with motor_state_lock:
+            async with motor_state_locks[motor_num]:
                 motor_states[motor_num] = next_angle 
                 
-            time.sleep(delay_s)
+            await asyncio.sleep(delay_s)
             
     # --- FINAL COMMAND ---
     # This runs for the final precise command, OR if we were just changing speed 
@@ -266,7 +275,7 @@ def set_motor_speed(motor_num, target_angle):
     set_duty_cycle(ch, clamped_target)
     
     # Update state to the final target
-    with motor_state_lock:
+    async with motor_state_locks[motor_num]:
         motor_states[motor_num] = clamped_target
             
     print(f"Motor {motor_num} holding at {clamped_target}°")
@@ -279,12 +288,11 @@ def stop_all_motors():
     print("\nStopping all motors and cleaning up...")
     
     if pca is not None:
-        for ch in motor_channels.values():
-            try:
-                # Set to 0 duty cycle (minimum pulse width, safe stop)
-                pca.channels[ch].duty_cycle = 0 
-            except:
-                pass
+        try:
+            # Set every channel to 0 duty cycle (minimum pulse width, safe stop) at once
+            set_all_duty_raw(0)
+        except:
+            pass
         
         try:
             pca.deinit()
@@ -307,98 +315,150 @@ signal.signal(signal.SIGINT, handle_exit)
 signal.signal(signal.SIGTERM, handle_exit)
 
 # --------------------------
-# Flask App
+# Quart App
 # --------------------------
-app = Flask(__name__)
+app = Quart(__name__)
+
+def ojsonify(obj):
+    """Like jsonify, but serializes with orjson (C-accelerated)."""
+    return Response(orjson.dumps(obj), mimetype="application/json")
+
+def start_motor_task(motor_num, target_angle):
+    """Schedules a speed transition, superseding any transition still running on that motor."""
+    # Only the newest command per motor matters: cancel the old ramp so rapid
+    # switch toggling can't queue up overlapping ramps on the same channel.
+    # motor_states already holds the angle it reached, so the new transition
+    # (including the neutral stop for reversals) starts from there.
+    previous = motor_tasks.get(motor_num)
+    if previous is not None and not previous.done():
+        previous.cancel()
+
+    task = asyncio.create_task(set_motor_speed(motor_num, target_angle))
+    motor_tasks[motor_num] = task
+
+    def forget(done_task):
+        if motor_tasks.get(motor_num) is done_task:
+            del motor_tasks[motor_num]
+    task.add_done_callback(forget)
+    return task
+
+# (motor, action) -> target angle, resolved once instead of per request
+ACTION_ANGLES = {}
+# Motor 1 and 3 are clockwise on UP (FORWARD) and reverse direction on DOWN (REVERSE)
+for m in ("1", "3"):
+    ACTION_ANGLES[(m, "forward")] = FORWARD_ANGLE
+    ACTION_ANGLES[(m, "reverse")] = REVERSE_ANGLE # Spin counter-clockwise (Reverse Pulse)
+# Motor 2 and 4 are counter-clockwise on UP (FORWARD) and clockwise on DOWN (REVERSE)
+for m in ("2", "4"):
+    ACTION_ANGLES[(m, "forward")] = REVERSE_ANGLE # Spin counter-clockwise (Reverse Pulse)
+    ACTION_ANGLES[(m, "reverse")] = FORWARD_ANGLE # Spin clockwise (Forward Pulse)
+for m in motor_channels.keys():
+    ACTION_ANGLES[(m, "stop")] = NEUTRAL_ANGLE
 
 @app.route("/motor/<motor_num>", methods=["POST"])
-def motor_control(motor_num):
+async def motor_control(motor_num):
     """API endpoint to control a single motor's speed (forward/stop/reverse)."""
     if motor_num not in motor_channels:
-        return jsonify({"status": "error", "message": f"Invalid motor number: {motor_num}. Available: {list(motor_channels.keys())}"}), 400
+        return ojsonify({"status": "error", "message": f"Invalid motor number: {motor_num}. Available: {list(motor_channels.keys())}"}), 400
 
     try:
-        data = request.get_json()
+        data = await request.get_json()
         if not data:
-            return jsonify({"status": "error", "message": "No JSON data provided"}), 400
+            return ojsonify({"status": "error", "message": "No JSON data provided"}), 400
             
         action = data.get("action", "").lower()
     except Exception:
-        return jsonify({"status": "error", "message": "Invalid JSON format"}), 400
+        return ojsonify({"status": "error", "message": "Invalid JSON format"}), 400
 
     print(f"\n>>> Motor {motor_num}: Action '{action}'")
 
-    target_angle = None
-    if action == "forward":
-        # Motor 1 and 3 are clockwise, 2 and 4 are counter-clockwise on UP (FORWARD)
-        if motor_num in ["1", "3"]:
-            target_angle = FORWARD_ANGLE
-        elif motor_num in ["2", "4"]:
-            target_angle = REVERSE_ANGLE # Spin counter-clockwise (Reverse Pulse)
-        
-    elif action == "stop":
-        target_angle = NEUTRAL_ANGLE
-        
-    elif action == "reverse": # <-- NEW ACTION HANDLER
-        # Motors reverse direction on DOWN (REVERSE)
-        if motor_num in ["1", "3"]:
-            target_angle = REVERSE_ANGLE # Spin counter-clockwise (Reverse Pulse)
-        elif motor_num in ["2", "4"]:
-            target_angle = FORWARD_ANGLE # Spin clockwise (Forward Pulse)
-            
-    else:
-        return jsonify({"status": "error", "message": "Invalid action. Use 'forward', 'reverse', or 'stop'."}), 400
+    target_angle = ACTION_ANGLES.get((motor_num, action))
+    if target_angle is None:
+        return ojsonify({"status": "error", "message": "Invalid action. Use 'forward', 'reverse', or 'stop'."}), 400
     
     # START ASYNCHRONOUS EXECUTION
-    # Start the motor speed transition in a separate thread.
-    thread = threading.Thread(target=set_motor_speed, args=(motor_num, target_angle))
-    thread.start()
+    # Schedule the motor speed transition as a task on the event loop.
+    start_motor_task(motor_num, target_angle)
 
-    # The Flask handler returns immediately, preventing the client timeout.
-    return jsonify({
+    # The handler returns immediately, preventing the client timeout.
+    return ojsonify({
         "status": "command_accepted", 
         "motor": motor_num, 
         "action": action, 
         "message": f"Speed transition for {action} started asynchronously."
     })
 
+@app.route("/motors", methods=["POST"])
+async def motors_control():
+    """API endpoint to control several motors in one request, e.g. {"1": "forward", "2": "stop"}."""
+    try:
+        data = await request.get_json()
+        if not data or not isinstance(data, dict):
+            return ojsonify({"status": "error", "message": "No JSON data provided"}), 400
+    except Exception:
+        return ojsonify({"status": "error", "message": "Invalid JSON format"}), 400
+
+    # Validate every entry before moving any motor
+    targets = {}
+    for motor_num, action in data.items():
+        if motor_num not in motor_channels:
+            return ojsonify({"status": "error", "message": f"Invalid motor number: {motor_num}. Available: {list(motor_channels.keys())}"}), 400
+        target_angle = ACTION_ANGLES.get((motor_num, str(action).lower()))
+        if target_angle is None:
+            return ojsonify({"status": "error", "message": f"Invalid action for motor {motor_num}. Use 'forward', 'reverse', or 'stop'."}), 400
+        targets[motor_num] = target_angle
+
+    print(f"\n>>> Motors: {data}")
+
+    # START ASYNCHRONOUS EXECUTION: one task per motor, all started from this one request
+    for motor_num, target_angle in targets.items():
+        start_motor_task(motor_num, target_angle)
+
+    return ojsonify({
+        "status": "command_accepted",
+        "motors": data,
+        "message": f"Speed transitions for {len(targets)} motor(s) started asynchronously."
+    })
+
 @app.route("/stop_all", methods=["POST"])
-def stop_all_route():
+async def stop_all_route():
     """API endpoint to stop all motors."""
     print("\n>>> STOP ALL COMMAND RECEIVED (Asynchronous)")
     for motor_num in motor_channels.keys():
-        # Start ramp down to neutral in a separate thread for each motor
-        thread = threading.Thread(target=set_motor_speed, args=(motor_num, NEUTRAL_ANGLE))
-        thread.start()
+        # Start ramp down to neutral as a separate task for each motor
+        start_motor_task(motor_num, NEUTRAL_ANGLE)
         
-    return jsonify({"status": "command_accepted", "message": "All motors commanded to stop (asynchronously)."}), 202
+    return ojsonify({"status": "command_accepted", "message": "All motors commanded to stop (asynchronously)."}), 202
+
+# Parts of the /status response that never change while the server runs
+STATIC_STATUS = {
+    "calibration_constants": {
+        "ARMING_PULSE": ARMING_ANGLE,
+        "NEUTRAL_ANGLE": NEUTRAL_ANGLE,
+        "FORWARD_ANGLE": FORWARD_ANGLE,
+        "REVERSE_ANGLE": REVERSE_ANGLE, # <-- ADDED
+    },
+    "hardware_initialized": pca is not None
+}
 
 @app.route("/status", methods=["GET"])
-def get_status():
+async def get_status():
     """Returns the current state of all motors and calibration constants."""
-    # Acquire lock before reading the state to ensure thread safety
-    with motor_state_lock:
-        current_motor_states = motor_states.copy()
-        
-    return jsonify({
+    # No lock needed: the copy runs on the event loop thread with no await in between,
+    # so no ramp task can write to motor_states while it is taken.
+    return ojsonify({
+        **STATIC_STATUS,
         "status": "running",
-        "motor_states": current_motor_states,
-        "calibration_constants": {
-            "ARMING_PULSE": ARMING_ANGLE,
-            "NEUTRAL_ANGLE": NEUTRAL_ANGLE,
-            "FORWARD_ANGLE": FORWARD_ANGLE,
-            "REVERSE_ANGLE": REVERSE_ANGLE, # <-- ADDED
-        },
-        "hardware_initialized": pca is not None
+        "motor_states": motor_states.copy()
     })
 
 @app.route("/shutdown", methods=["POST"])
-def shutdown_route():
+async def shutdown_route():
     """API endpoint to safely shut down the server and motors."""
     print("\n>>> SHUTDOWN COMMAND RECEIVED")
     stop_all_motors()
     sys.exit(0) # Terminate the process cleanly
-    return jsonify({"status": "ok", "message": "System is shutting down."})
+    return ojsonify({"status": "ok", "message": "System is shutting down."})
 
 # --------------------------
 # Main
@@ -416,4 +476,11 @@ if __name__ == "__main__":
     print("Use GET /status to check current motor angles.")
     print("="*50 + "\n")
     
-    app.run(host="0.0.0.0", port=5001, threaded=True, use_reloader=False)
+    # Quart serves through Hypercorn on a single asyncio event loop.
+    # Run this file directly (not `hypercorn NEW_server_flask:app`) so the ESCs get armed first.
+    # Hypercorn is started here rather than via app.run() so the access log can be
+    # turned off: app.run() sets up its own logging and would override it.
+    config = Config()
+    config.bind = ["0.0.0.0:5001"]
+    config.accesslog = None # No per-request log lines for the switch client's traffic
+    asyncio.run(serve(app, config))
@@ -2,7 +2,10 @@
 import RPi.GPIO as GPIO
 import time
 import requests
+import orjson
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, Timeout, HTTPError
+import signal
 import sys
 
 # --------------------------
@@ -17,9 +20,15 @@ SERVER_PORT = 5001
 REQUEST_TIMEOUT = 1.0 
 
 # --- Debouncing Constant ---
-# Time (in seconds) to wait after a state change before accepting a new input.
+# Time (in seconds) to ignore further edges on a pin after a change (GPIO bouncetime).
 DEBOUNCE_TIME = 0.02 
 
+# --- HTTP Session ---
+# One persistent keep-alive connection to the motor server, reused for every
+# command instead of opening a new TCP connection per switch change.
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
 # --------------------------
 # Switch Pin Mapping (BCM)
 # Each motor has: (up_pin, down_pin)
@@ -46,88 +55,111 @@ except Exception as e:
 # --------------------------
 # Helper: Send Command
 # --------------------------
-def send_motor_command(motor_num, action):
+def send_motor_commands(commands):
     """
-    Sends: {"action": "forward"} or {"action": "stop"}.
+    Sends every changed motor in one request: {"1": "forward", "2": "stop", ...}.
     Handles specific network errors.
     """
-    url = f"http://{SERVER_IP}:{SERVER_PORT}/motor/{motor_num}"
+    url = f"http://{SERVER_IP}:{SERVER_PORT}/motors"
+    motors = ", ".join(commands.keys())
     try:
         # Use the slightly increased timeout
-        resp = requests.post(url, json={"action": action}, timeout=REQUEST_TIMEOUT)
+        resp = SESSION.post(url, json=commands, timeout=REQUEST_TIMEOUT)
         resp.raise_for_status() # Raise exception for bad status codes (4xx or 5xx)
         
         # Server now returns 'command_accepted' immediately
-        print(f"Motor {motor_num} → {action}: {resp.json().get('message', 'Success')}")
+        print(f"Motors {commands}: {orjson.loads(resp.content).get('message', 'Success')}")
         
     except Timeout:
         # This is the error you were seeing, now better handled and less likely due to server change
-        print(f"Motor {motor_num}: ERROR sending command: Request timed out after {REQUEST_TIMEOUT}s. (Server busy?)")
+        print(f"Motors {motors}: ERROR sending command: Request timed out after {REQUEST_TIMEOUT}s. (Server busy?)")
     except ConnectionError:
-        print(f"Motor {motor_num}: CRITICAL ERROR: Could not connect to server at {SERVER_IP}:{SERVER_PORT}. Is it running?")
+        print(f"Motors {motors}: CRITICAL ERROR: Could not connect to server at {SERVER_IP}:{SERVER_PORT}. Is it running?")
     except HTTPError as err:
-        print(f"Motor {motor_num}: HTTP Error {err.response.status_code}. Response: {err.response.json()}")
+        print(f"Motors {motors}: HTTP Error {err.response.status_code}. Response: {err.response.text}")
     except Exception as e:
-        print(f"Motor {motor_num}: Unknown Error sending command: {e}")
+        print(f"Motors {motors}: Unknown Error sending command: {e}")
 
 def send_shutdown_command():
     """Sends command to safely stop all motors and shut down the server process."""
     url = f"http://{SERVER_IP}:{SERVER_PORT}/shutdown"
     try:
         print("\nSending server shutdown command...")
-        requests.post(url, timeout=REQUEST_TIMEOUT)
+        SESSION.post(url, timeout=REQUEST_TIMEOUT)
     except:
         # Ignore errors during shutdown command, as server may close connection instantly
         pass
 
 # --------------------------
-# Main Loop
+# Switch Change Handling
 # --------------------------
 # Track last known states to avoid spamming server
 last_states = {m: None for m in switch_pins.keys()}
-# Track last time a command was accepted to implement debouncing
-last_input_time = {m: 0.0 for m in switch_pins.keys()}
 
+# Switch position -> motor action
+#   UP means full forward speed, DOWN means full reverse speed,
+#   CENTER (neutral position) maps to the 'stop' command.
+state_actions = {"UP": "forward", "DOWN": "reverse", "CENTER": "stop"}
+
+# Switch table flattened once so each scan iterates a tuple instead of a dict view
+switch_list = tuple(switch_pins.items())
+
+def read_switch_state(up_pin, down_pin, gpio_input=GPIO.input):
+    """Reads a switch's pins and returns UP, DOWN, or CENTER."""
+    up = gpio_input(up_pin)
+    down = gpio_input(down_pin)
+
+    # Determine switch state (Assuming a simple 3-position switch: UP, DOWN, or CENTER/NEUTRAL)
+    if up == 0 and down == 1:
+        return "UP" # Signal UP (Forward)
+    elif up == 1 and down == 0:
+        return "DOWN" # Signal DOWN (Reverse)
+    else:
+        return "CENTER" # Neither/Both (Stop)
+
+def handle_switch_changes():
+    """Checks every switch and sends all changed positions to the server in one request."""
+    commands = {}
+    for motor_num, (up_pin, down_pin) in switch_list:
+        state = read_switch_state(up_pin, down_pin)
+        # Only send a command when the switch position actually changed
+        if state != last_states[motor_num]:
+            commands[motor_num] = state_actions[state]
+            last_states[motor_num] = state
+
+    if commands:
+        send_motor_commands(commands)
+
+def on_switch_edge(channel):
+    """GPIO edge callback: lets the contacts settle, then reads every switch."""
+    # bouncetime drops every edge inside the window, including the one where the
+    # contact finally settles, so wait it out here before reading the pins.
+    # Callbacks run one at a time on RPi.GPIO's thread; edges during the wait queue up.
+    time.sleep(DEBOUNCE_TIME)
+    handle_switch_changes()
 
+# --------------------------
+# Main
+# --------------------------
 print(f"Monitoring {len(switch_pins)} motor switches → controlling motor server at {SERVER_IP}:{SERVER_PORT}.")
 print("Press CTRL+C to stop.\n")
 
 try:
-    while True:
-        current_time = time.time()
-        for motor_num, (up_pin, down_pin) in switch_pins.items():
-
-            up = GPIO.input(up_pin)
-            down = GPIO.input(down_pin)
-
-            # Determine switch state (Assuming a simple 3-position switch: UP, DOWN, or CENTER/NEUTRAL)
-            if up == 0 and down == 1:
-                state = "UP" # Signal UP (Forward)
-            elif up == 1 and down == 0:
-                state = "DOWN" # Signal DOWN (Reverse)
-            else:
-                state = "CENTER" # Neither/Both (Stop)
-
-            # Check for state change AND debounce time elapsed
-            if state != last_states[motor_num] and (current_time - last_input_time[motor_num] > DEBOUNCE_TIME):
-
-                if state == "UP":
-                    # UP means full forward speed
-                    send_motor_command(motor_num, "forward")
-                
-                elif state == "DOWN":
-                    # DOWN means full reverse speed
-                    send_motor_command(motor_num, "reverse") # <--- NEW COMMAND
-
-                else:
-                    # CENTER (neutral position) maps to the 'stop' command.
-                    send_motor_command(motor_num, "stop")
-
-                # Update the state and the time stamp only after sending a command
-                last_states[motor_num] = state
-                last_input_time[motor_num] = current_time
-
-        time.sleep(0.05)
+    # Send the starting position of every switch once
+    handle_switch_changes()
+
+    # Interrupt-driven from here on: RPi.GPIO calls on_switch_edge (debounced by
+    # bouncetime) on any edge of any switch pin, so nothing polls. Switches moved
+    # together are picked up by the same call and sent as one request.
+    bouncetime_ms = int(DEBOUNCE_TIME * 1000)
+    for up_pin, down_pin in switch_pins.values():
+        for pin in (up_pin, down_pin):
+            GPIO.add_event_detect(pin, GPIO.BOTH,
+                                  callback=on_switch_edge,
+                                  bouncetime=bouncetime_ms)
+
+    # Sleep until a signal (e.g. CTRL+C) arrives; callbacks run on RPi.GPIO's own thread
+    signal.pause()
 
 except KeyboardInterrupt:
     print("\nClient interrupted.")
@@ -1,11 +1,34 @@
-from flask import Flask, render_template_string, jsonify, Response
+# I2C SPEED: The BNO055 and INA260 support 400kHz Fast Mode but the Pi defaults to 100kHz.
+# Add this line to /boot/config.txt and reboot:
+#     dtparam=i2c_arm_baudrate=400000
+# The server prints a warning at startup if the bus is still slower than that.
+# NOTE: The BNO055 uses I2C clock stretching, which the Pi handles poorly. If accel reads
+# start failing after the change, go back to the default speed.
+from flask import Flask, Response, request
+from waitress import serve
+import orjson
+import atexit
+import gzip
+import hashlib
+import io
 import os
+import queue
+import signal
+import sys
 import time
+import struct
+import threading
 from smbus2 import SMBus
 from picamera2 import Picamera2
-import cv2
+from picamera2.encoders import MJPEGEncoder, H264Encoder
+from picamera2.outputs import FileOutput
 
-app = Flask(__name__)
+# Static files are served by the precompressed static_asset() route below, not Flask's default handler
+app = Flask(__name__, static_folder=None)
+
+def ojsonify(obj):
+    """Like jsonify, but serializes with orjson (C-accelerated)."""
+    return Response(orjson.dumps(obj), mimetype='application/json')
 
 # ==========================
 # I2C Setup and Initialization
@@ -15,12 +38,46 @@ BNO055_ADDRESS = 0x28
 OPR_MODE = 0x3D
 ACCEL_X_LSB = 0x09
 IMU_MODE = 0x08 # NDOF Mode for full features, or ACCEL mode 0x08 for just accel
+ACCEL_FORMAT = struct.Struct('<hhh') # X, Y, Z as 16-bit little-endian signed integers
 
 # INA260 (Current Sensor)
 INA260_ADDRESS = 0x40
 INA260_CURRENT_REG = 0x01 # Current Register
 INA260_VOLTAGE_REG = 0x02 # Bus Voltage Register
 INA260_POWER_REG = 0x03 # Power Register
+INA260_CONFIG_REG = 0x00 # Configuration Register
+INA260_MANUFACTURER_ID_REG = 0xFE # Manufacturer ID Register
+INA260_MANUFACTURER_ID = 0x5449 # "TI" in ASCII
+INA260_FORMAT = struct.Struct('>HhH') # Voltage, current, power, each 16-bit big-endian; only current is signed (two's complement)
+INA260_SMBUS_WORDS = struct.Struct('<HHH') # The same three words as read_word_data returns them (first byte low)
+# INA260 CONFIG fields: the sensor converts and averages continuously in the background,
+# so the result registers always hold a finished average and reads never need to wait.
+INA260_AVG_16 = 0b010 # AVG [11:9]: average 16 samples per result
+INA260_CT_1100US = 0b100 # VBUSCT [8:6] / ISHCT [5:3]: 1.1ms per conversion
+INA260_MODE_CONTINUOUS = 0b111 # MODE [2:0]: shunt current + bus voltage, continuous
+# New result every 16 x (1.1ms + 1.1ms) ~= 35ms; bits [15:12] keep their reset value (0b0110)
+INA260_CONFIG_AVG16 = ((0b0110 << 12) | (INA260_AVG_16 << 9) | (INA260_CT_1100US << 6)
+                       | (INA260_CT_1100US << 3) | INA260_MODE_CONTINUOUS)
+
+# I2C Fast Mode (see header comment) and where the Pi exposes the active bus speed
+I2C_FAST_MODE_HZ = 400000
+I2C_CLOCK_FREQ_PATH = "/sys/class/i2c-adapter/i2c-1/of_node/clock-frequency"
+
+def check_i2c_baudrate():
+    """Warns if the Pi's I2C bus is not running at 400kHz Fast Mode."""
+    try:
+        with open(I2C_CLOCK_FREQ_PATH, "rb") as f:
+            # Device-tree property: a single big-endian 32-bit integer
+            freq = int.from_bytes(f.read(4), "big")
+    except OSError:
+        print("Warning: Could not read I2C bus frequency (non-Pi environment?).")
+        return
+    if freq < I2C_FAST_MODE_HZ:
+        print(f"Warning: I2C bus is at {freq // 1000}kHz. Add 'dtparam=i2c_arm_baudrate=400000' to /boot/config.txt and reboot.")
+    else:
+        print(f"I2C bus running at {freq // 1000}kHz.")
+
+check_i2c_baudrate()
 
 # Initialize I2C Bus (Bus 1 is common for Raspberry Pi)
 try:
@@ -38,60 +95,60 @@ except Exception as e:
     print(f"Error initializing BNO055 or I2C: {e}. Sensor data will be mocked.")
     i2c_bus = None
 
+# Configure INA260 on-chip averaging once so reads don't need CPU-side sampling
+if i2c_bus:
+    try:
+        # 0x40 is also the PCA9685's default address, so only write CONFIG once the
+        # chip there identifies itself as an INA260.
+        # SMBus words are LSB first; the INA260 sends and expects MSB first.
+        raw_id = i2c_bus.read_word_data(INA260_ADDRESS, INA260_MANUFACTURER_ID_REG)
+        manufacturer_id = ((raw_id & 0xFF) << 8) | (raw_id >> 8)
+        if manufacturer_id == INA260_MANUFACTURER_ID:
+            config_swapped = ((INA260_CONFIG_AVG16 & 0xFF) << 8) | (INA260_CONFIG_AVG16 >> 8)
+            i2c_bus.write_word_data(INA260_ADDRESS, INA260_CONFIG_REG, config_swapped)
+            print("INA260 configured (16-sample hardware averaging).")
+        else:
+            print(f"Warning: device at 0x{INA260_ADDRESS:02X} is not an INA260 "
+                  f"(manufacturer ID 0x{manufacturer_id:04X}). Skipping averaging setup.")
+    except Exception as e:
+        print(f"Error configuring INA260 averaging: {e}")
+
 
 # ==========================
 # Sensor Reading Functions
 # ==========================
 
-def read_i2c_reg16(address, reg):
-    """Reads a 16-bit register word and swaps bytes (INA260 returns LSB/MSB swapped)."""
-    if not i2c_bus:
-        return 0
-    try:
-        raw = i2c_bus.read_word_data(address, reg)
-        # Swap LSB and MSB
-        raw = ((raw & 0xFF) << 8) | (raw >> 8)
-        return raw
-    except Exception as e:
-        print(f"Error reading I2C register {reg} from {address}: {e}")
-        return 0
-
-
-def read_current_sensor(samples=10):
+def read_current_sensor():
     """
     Reads and calculates INA260 Voltage, Current, and Power.
-    Uses an average of 'samples' readings for stabilization.
+    Averaging is done on the sensor (see INA260_CONFIG_AVG16), so one read per register is enough.
     """
     if not i2c_bus:
         return {"voltage": 0.0, "current": 0.0, "power": 0.0}
 
-    # Initialize lists for averaging
-    voltage_sum = 0
-    current_sum = 0
-    power_sum = 0
-
-    for _ in range(samples):
-        voltage_raw = read_i2c_reg16(INA260_ADDRESS, INA260_VOLTAGE_REG)
-        current_raw = read_i2c_reg16(INA260_ADDRESS, INA260_CURRENT_REG)
-        power_raw = read_i2c_reg16(INA260_ADDRESS, INA260_POWER_REG)
-
-        # Conversion factors for INA260 (Default settings):
-        voltage_sum += voltage_raw * 0.00125 # 1.25 mV per bit
-        current_sum += current_raw * 1.25 # 1.25 mA per LSB
-        power_sum += power_raw * 10 # 10 mW per LSB
-        
-        # A small sleep to allow the sensor to update its registers (usually 4ms or less)
-        time.sleep(0.005) 
+    try:
+        # The INA260 register pointer doesn't auto-increment and the Pi's bcm2835 driver
+        # won't combine several reads into one transfer, so it's one SMBus read per register.
+        # Repacking the words puts the bytes back in wire order for a single big-endian decode.
+        raw = INA260_SMBUS_WORDS.pack(
+            i2c_bus.read_word_data(INA260_ADDRESS, INA260_VOLTAGE_REG),
+            i2c_bus.read_word_data(INA260_ADDRESS, INA260_CURRENT_REG),
+            i2c_bus.read_word_data(INA260_ADDRESS, INA260_POWER_REG)
+        )
+        voltage_raw, current_raw, power_raw = INA260_FORMAT.unpack(raw)
+    except Exception as e:
+        print(f"Error reading INA260: {e}")
+        return {"voltage": 0.0, "current": 0.0, "power": 0.0}
 
-    # Calculate averages
-    avg_voltage = voltage_sum / samples
-    avg_current = current_sum / samples
-    avg_power = power_sum / samples
+    # Conversion factors for INA260 (Default settings):
+    voltage = voltage_raw * 0.00125 # 1.25 mV per bit
+    current = current_raw * 1.25 # 1.25 mA per LSB
+    power = power_raw * 10 # 10 mW per LSB
 
     return {
-        "voltage": round(avg_voltage, 3), # V
-        "current": round(avg_current, 2), # mA
-        "power": round(avg_power, 2) # mW
+        "voltage": round(voltage, 3), # V
+        "current": round(current, 2), # mA
+        "power": round(power, 2) # mW
     }
 
 def read_accel():
@@ -104,53 +161,181 @@ def read_accel():
         # Read 6 bytes starting from ACCEL_X_LSB
         data = i2c_bus.read_i2c_block_data(BNO055_ADDRESS, ACCEL_X_LSB, 6)
         
-        # Convert 16-bit little-endian signed integers (BNO055 is in units of 100 LSB/g)
-        x = int.from_bytes(data[0:2], 'little', signed=True) / 100.0
-        y = int.from_bytes(data[2:4], 'little', signed=True) / 100.0
-        z = int.from_bytes(data[4:6], 'little', signed=True) / 100.0
+        # Decode all three axes in one call (BNO055 is in units of 100 LSB/g)
+        x_raw, y_raw, z_raw = ACCEL_FORMAT.unpack(bytes(data))
         
-        return {"x": round(x, 2), "y": round(y, 2), "z": round(z, 2)}
+        return {"x": round(x_raw / 100.0, 2), "y": round(y_raw / 100.0, 2), "z": round(z_raw / 100.0, 2)}
     except Exception as e:
         print(f"Error reading BNO055: {e}")
         return {"x": 0.0, "y": 0.0, "z": 0.0}
 
+def read_sensors():
+    """Reads accel + power data in the shape served by /sensors."""
+    return {
+        "accel": read_accel(),
+        "current_sensor": read_current_sensor()
+    }
+
+# ==========================
+# Sensor Sampler and Push (Server-Sent Events)
+# ==========================
+# A single background thread owns all sensor I2C reads, so bus traffic depends on
+# SENSOR_PUSH_INTERVAL only, never on how many dashboards are connected.
+SENSOR_PUSH_INTERVAL = 0.2 # seconds between sensor samples pushed to dashboards
+SSE_KEEPALIVE = 15.0 # seconds; comment line sent when nothing changed, to detect closed clients
+sensor_update = threading.Condition()
+# "encoded" holds (JSON bytes, ETag) of the latest payload, serialized once per sample
+# and shared by every /sensors response and SSE message
+sensor_latest = {"seq": 0, "payload": None, "encoded": None}
+
+def encode_sensor_payload(payload):
+    """Serializes a sensor payload once, returning (JSON bytes, ETag)."""
+    body = orjson.dumps(payload)
+    return body, hashlib.md5(body).hexdigest()
+
+def sensor_sampler():
+    """Background thread: samples the sensors and wakes up every stream client on a change."""
+    while True:
+        payload = read_sensors()
+        with sensor_update:
+            # Only push when a reading actually changed
+            if payload != sensor_latest["payload"]:
+                sensor_latest["payload"] = payload
+                sensor_latest["encoded"] = encode_sensor_payload(payload)
+                sensor_latest["seq"] += 1
+                sensor_update.notify_all()
+        time.sleep(SENSOR_PUSH_INTERVAL)
+
+def sensor_event_stream():
+    """Yields one SSE message per new sensor sample."""
+    last_seq = 0 # sensor_latest starts at seq 0 with nothing encoded, so wait for the first sample
+    while True:
+        with sensor_update:
+            sensor_update.wait_for(lambda: sensor_latest["seq"] != last_seq, timeout=SSE_KEEPALIVE)
+            seq = sensor_latest["seq"]
+            encoded = sensor_latest["encoded"]
+        if seq == last_seq or encoded is None:
+            yield b": keepalive\n\n"
+            continue
+        last_seq = seq
+        yield b"data: " + encoded[0] + b"\n\n"
+
+threading.Thread(target=sensor_sampler, daemon=True).start()
+
 
 # ==========================
 # Pi Camera Setup
 # ==========================
+FRAME_WAIT_TIMEOUT = 1.0 # seconds a client waits for a new frame before re-sending the last one
+
+class StreamingOutput(io.BufferedIOBase):
+    """Holds the latest JPEG from the hardware encoder and wakes up waiting stream clients."""
+    def __init__(self):
+        self.frame = None
+        self.condition = threading.Condition()
+
+    def write(self, buf):
+        with self.condition:
+            self.frame = buf
+            self.condition.notify_all()
+
+output = StreamingOutput()
+
+# H.264 side stream for viewers that can decode it (e.g. VLC/ffplay); MJPEG stays the default
+H264_BITRATE = 2_000_000 # bits/s
+H264_CLIENT_BACKLOG = 30 # NAL buffers queued per client before new ones are dropped
+
+class H264StreamOutput(io.BufferedIOBase):
+    """Fans out H.264 data from the hardware encoder to every connected /stream.h264 client."""
+    def __init__(self):
+        self.clients = set()
+        self.lock = threading.Lock()
+
+    def write(self, buf):
+        with self.lock:
+            for client_queue in self.clients:
+                try:
+                    client_queue.put_nowait(buf)
+                except queue.Full:
+                    # Slow client: drop data; it recovers at the next keyframe (headers repeat)
+                    pass
+        return len(buf)
+
+    def add_client(self, client_queue):
+        with self.lock:
+            self.clients.add(client_queue)
+
+    def remove_client(self, client_queue):
+        with self.lock:
+            self.clients.discard(client_queue)
+
+h264_output = H264StreamOutput()
+
 try:
     picam2 = Picamera2()
-    # Use a smaller resolution for better streaming performance
-    config = picam2.create_video_configuration(main={"size": (320, 240)}) 
+    # Use a smaller resolution for better streaming performance.
+    # YUV420 is what the hardware encoders consume natively and is 1.5 bytes/pixel
+    # instead of 4 for the default XBGR8888, so each frame buffer moves far less memory.
+    # buffer_count=6 gives the encoders slack when Python stalls (GC, slow clients, I2C reads).
+    config = picam2.create_video_configuration(main={"size": (320, 240), "format": "YUV420"},
+                                               buffer_count=6)
     picam2.configure(config)
-    picam2.start()
+    # JPEG encoding is done by the Pi's hardware encoder, not in Python
+    picam2.start_recording(MJPEGEncoder(), FileOutput(output))
     print("PiCamera2 initialized.")
 except Exception as e:
     print(f"Error initializing PiCamera2: {e}. Camera stream will be skipped.")
     picam2 = None
 
+h264_enabled = False
+if picam2:
+    try:
+        # Second hardware encoder on the same stream. repeat=True re-sends SPS/PPS
+        # headers with every keyframe so clients can join mid-stream.
+        picam2.start_encoder(H264Encoder(bitrate=H264_BITRATE, repeat=True, iperiod=30), FileOutput(h264_output))
+        h264_enabled = True
+        print("H.264 stream initialized.")
+    except Exception as e:
+        print(f"Error starting H.264 encoder: {e}. Only the MJPEG stream will be available.")
+
 def generate_frames():
     if not picam2:
         return
         
+    # Each client waits on its own, always taking the newest frame. A client that
+    # is slow to send simply skips the frames it missed instead of falling behind
+    # or holding up the other clients.
     while True:
-        try:
-            # Capture frame and encode to JPEG for streaming
-            frame = picam2.capture_array()
-            
-            # --- FIX FOR SWAPPED RED/BLUE CHANNELS ---
-            # Picamera2 often outputs RGB, but cv2.imencode/streaming expects BGR channel order.
-            frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR) 
-            
-            ret, buffer = cv2.imencode('.jpg', frame)
-            frame_bytes = buffer.tobytes()
-            
-            # Yield the JPEG data in the Motion JPEG format
-            yield (b'--frame\r\n'
-                   b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
-        except Exception as e:
-            print(f"Error generating camera frame: {e}")
-            time.sleep(1)
+        # Wait for the encoder to hand over the next JPEG
+        with output.condition:
+            output.condition.wait(timeout=FRAME_WAIT_TIMEOUT)
+            frame_bytes = output.frame
+        
+        # No frame yet (camera still starting); re-sending the last frame on a
+        # timeout keeps writing so a disconnected client gets noticed.
+        if frame_bytes is None:
+            continue
+        
+        # Yield the JPEG data in the Motion JPEG format
+        yield (b'--frame\r\n'
+               b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
+
+
+def generate_h264():
+    """Yields raw H.264 (Annex B) data for one client as the encoder produces it."""
+    client_queue = queue.Queue(maxsize=H264_CLIENT_BACKLOG)
+    h264_output.add_client(client_queue)
+    try:
+        while True:
+            try:
+                yield client_queue.get(timeout=FRAME_WAIT_TIMEOUT)
+            except queue.Empty:
+                # Encoder stalled or stopped. Nothing gets written while it's quiet, so a
+                # disconnected client would never be noticed; end the response instead so
+                # the worker thread is freed (a client still watching has to reconnect).
+                return
+    finally:
+        h264_output.remove_client(client_queue)
 
 
 # ==========================
@@ -162,145 +347,8 @@ HTML_PAGE = """
 <head>
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Underwater Vehicle Laboratory</title>
-    <style>
-        body { font-family: sans-serif; text-align: center; background: #2c3e50; color: #ecf0f1; }
-        h1 { color: #ecf0f1; margin-top: 30px; border-bottom: 2px solid #34495e; padding-bottom: 10px;}
-        h2 { color: #f1c40f; margin-top: 20px; }
-        .authors { color: #bdc3c7; margin-top: -15px; margin-bottom: 20px; font-size: 0.9em; }
-        
-        /* Base Dashboard: Stacked by default */
-        .dashboard { 
-            display: flex; 
-            flex-direction: column; 
-            flex-wrap: nowrap; 
-            align-items: center; 
-            gap: 20px; 
-            margin-top: 30px; 
-            padding: 0 10px; 
-        }
-        
-        /* Card Styling (Full width on small screens by default) */
-        .sensor-card { 
-            background: #34495e; 
-            padding: 20px; 
-            border-radius: 10px; 
-            width: 100%; 
-            max-width: 500px; 
-            box-shadow: 0 4px 8px rgba(0,0,0,0.5);
-            text-align: left;
-        }
-        .sensor-card h3 { color: #3498db; margin-bottom: 10px; font-size: 1.2em; }
-        .data-point { font-size: 1.1em; margin-bottom: 8px; }
-        .value { font-weight: bold; color: #2ecc71; }
-        
-        /* Camera Container Styling */
-        .camera-container { 
-            flex-basis: auto; 
-            width: 100%; 
-            max-width: 640px; 
-        }
-        .camera-container img { 
-            margin-top: 20px; 
-            border: 4px solid #3498db; 
-            border-radius: 8px; 
-            width: 100%; 
-            height: auto; 
-        }
-        
-        /* Sensor Wrapper: Full width by default, keeps cards stacked vertically */
-        .sensor-wrapper {
-            width: 100%;
-            display: flex; /* Activate flex for the wrapper */
-            flex-direction: column; /* Stack sensor cards vertically on phones */
-            align-items: center;
-            gap: 20px;
-        }
-
-        /* --- Media Query 1: Laptop/Desktop View (>= 768px wide) --- */
-        @media (min-width: 768px) {
-            /* The overall dashboard remains column stacked (Camera on top, wrapper below) */
-            
-            /* Sensor Wrapper: Allow sensor cards to be side-by-side */
-            .sensor-wrapper {
-                flex-direction: row; /* Place cards side-by-side */
-                justify-content: center;
-                max-width: 1040px; /* Limits the overall width of the two side-by-side cards */
-            }
-            .sensor-card {
-                flex-basis: 500px;
-                max-width: 500px;
-            }
-        }
-        
-        /* --- Media Query 2: Landscape Phone View (<= 767px wide AND landscape) --- */
-        @media (max-width: 767px) and (orientation: landscape) {
-            .dashboard {
-                /* Allow side-by-side layout for the main elements */
-                flex-direction: row; 
-                flex-wrap: nowrap;
-                justify-content: space-between;
-                align-items: flex-start; /* Align content to the top */
-            }
-            
-            /* Camera: Dominates the left side */
-            .camera-container {
-                flex-basis: 70%; 
-                max-width: 70%;
-                margin-top: 0;
-            }
-            .camera-container img {
-                width: 100%;
-                /* Constrain height to fit in the viewport without pushing elements down */
-                max-height: 80vh; 
-            }
-
-            /* Sensor Wrapper: Takes the remaining space on the right side */
-            .sensor-wrapper {
-                flex-basis: 25%; /* Takes about 25% of the screen */
-                max-width: 25%;
-                width: 100%;
-                /* Revert sensor cards to stack vertically inside the wrapper */
-                flex-direction: column; 
-            }
-            .sensor-card {
-                width: 100%; /* Fill the 25% wrapper width */
-                min-width: unset; /* Remove minimum width constraint */
-                padding: 10px; /* Reduce padding for tight space */
-            }
-            h2 { margin-top: 0; }
-        }
-
-    </style>
-    <script>
-        async function updateSensors() {
-            try {
-                const response = await fetch('/sensors');
-                const data = await response.json();
-                
-                // Update Accelerometer
-                document.getElementById('accel_x').textContent = `${data.accel.x} g`;
-                document.getElementById('accel_y').textContent = `${data.accel.y} g`;
-                document.getElementById('accel_z').textContent = `${data.accel.z} g`;
-                
-                // Update Current Sensor
-                document.getElementById('current').textContent = `${data.current_sensor.current} mA`;
-                document.getElementById('voltage').textContent = `${data.current_sensor.voltage} V`;
-                document.getElementById('power').textContent = `${data.current_sensor.power} mW`;
-                
-            } catch (err) {
-                console.error("Failed to fetch sensor data:", err);
-                // Display error messages
-                document.getElementById('accel_x').textContent = 'Error';
-                document.getElementById('cUVurrent').textContent = 'Error';
-            }
-        }
-
-        // Fetch data every 500ms
-        setInterval(updateSensors, 500);
-        
-        // Initial load
-        window.onload = updateSensors;
-    </script>
+    <link rel="stylesheet" href="/static/app.css?v=__APP_CSS_VERSION__">
+    <script src="/static/app.js?v=__APP_JS_VERSION__" defer></script>
 </head>
 <body>
     <h1>Underwater Vehicle Laboratory</h1>
@@ -334,45 +382,146 @@ HTML_PAGE = """
 </body>
 </html>
 """
+
+# ==========================
+# Static Assets (CSS/JS)
+# ==========================
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+# Asset URLs carry a content hash (?v=...), so browsers may keep them for a year
+STATIC_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+STATIC_MIMETYPES = {'.css': 'text/css', '.js': 'text/javascript'}
+
+def load_static_assets():
+    """Reads and gzips every CSS/JS file in STATIC_DIR once at startup."""
+    assets = {}
+    for name in sorted(os.listdir(STATIC_DIR)):
+        mimetype = STATIC_MIMETYPES.get(os.path.splitext(name)[1])
+        if mimetype is None:
+            continue
+        with open(os.path.join(STATIC_DIR, name), 'rb') as f:
+            data = f.read()
+        assets[name] = {
+            "mimetype": mimetype,
+            "data": data,
+            "gz": gzip.compress(data, 9),
+            "etag": hashlib.md5(data).hexdigest()
+        }
+    return assets
+
+STATIC_ASSETS = load_static_assets()
+HTML_PAGE = (HTML_PAGE
+             .replace('__APP_CSS_VERSION__', STATIC_ASSETS['app.css']['etag'][:12])
+             .replace('__APP_JS_VERSION__', STATIC_ASSETS['app.js']['etag'][:12]))
+
+def precompressed_response(data, gz, etag, mimetype, cache_control):
+    """Builds a cacheable response from prebuilt bytes (304 / gzip / plain as the client allows)."""
+    # A strong ETag names exact bytes, so the gzip body gets its own tag
+    gz_etag = etag + '-gz'
+    use_gzip = 'gzip' in request.accept_encodings
+    if etag in request.if_none_match or gz_etag in request.if_none_match:
+        resp = Response(status=304)
+    elif use_gzip:
+        resp = Response(gz, mimetype=mimetype)
+        resp.headers['Content-Encoding'] = 'gzip'
+    else:
+        resp = Response(data, mimetype=mimetype)
+    resp.set_etag(gz_etag if use_gzip else etag)
+    resp.headers['Cache-Control'] = cache_control
+    resp.vary.add('Accept-Encoding')
+    return resp
+
+# The page has no template variables, so encode + compress it once at startup
+HTML_PAGE_BYTES = HTML_PAGE.encode('utf-8')
+HTML_PAGE_GZ = gzip.compress(HTML_PAGE_BYTES, 9)
+HTML_PAGE_ETAG = hashlib.md5(HTML_PAGE_BYTES).hexdigest()
+HTML_PAGE_CACHE_CONTROL = 'public, max-age=3600, immutable'
+
 # ==========================
 # Flask Routes
 # ==========================
 @app.route('/')
 def home():
-    """Renders the main dashboard HTML page."""
-    return render_template_string(HTML_PAGE)
+    """Serves the pre-built main dashboard HTML page."""
+    return precompressed_response(HTML_PAGE_BYTES, HTML_PAGE_GZ, HTML_PAGE_ETAG,
+                                  'text/html', HTML_PAGE_CACHE_CONTROL)
+
+@app.route('/static/<filename>')
+def static_asset(filename):
+    """Serves the dashboard's CSS/JS from the precompressed copies built at startup."""
+    asset = STATIC_ASSETS.get(filename)
+    if asset is None:
+        return ojsonify({"status": "error", "message": f"Unknown static file: {filename}"}), 404
+    return precompressed_response(asset["data"], asset["gz"], asset["etag"],
+                                  asset["mimetype"], STATIC_CACHE_CONTROL)
 
 @app.route('/sensors')
 def sensors():
     """API endpoint to get real-time sensor data as JSON."""
-    accel_data = read_accel()
-    # Call read_current_sensor with default 10 samples
-    current_sensor_data = read_current_sensor() 
-    
-    return jsonify({
-        "accel": accel_data,
-        "current_sensor": current_sensor_data
-    })
+    # Latest sample from the background sampler; replacing a dict value is atomic,
+    # so this read needs no lock and never touches the I2C bus (except before the first sample).
+    encoded = sensor_latest["encoded"]
+    if encoded is None:
+        encoded = encode_sensor_payload(read_sensors())
+    body, etag = encoded
+    resp = Response(body, mimetype='application/json')
+    # Let browsers revalidate with If-None-Match and get a 304 when nothing changed
+    resp.headers['Cache-Control'] = 'max-age=0, must-revalidate'
+    resp.set_etag(etag)
+    return resp.make_conditional(request)
+
+# Headers for live streams: never cache them, and tell reverse proxies (nginx) not to
+# buffer them, so each frame/sample goes out as soon as it is yielded.
+# (No "Connection" header: it is hop-by-hop and WSGI servers reject it.)
+LIVE_STREAM_HEADERS = {
+    'Cache-Control': 'no-store, no-transform',
+    'Pragma': 'no-cache',
+    'X-Accel-Buffering': 'no'
+}
+
+@app.route('/sensors/stream')
+def sensors_stream():
+    """Server-Sent Events endpoint that pushes each new sensor sample."""
+    return Response(sensor_event_stream(), mimetype='text/event-stream',
+                    headers=LIVE_STREAM_HEADERS)
 
 @app.route('/stream')
 def stream():
     """Video streaming endpoint for the PiCamera2 feed."""
+    # generate_frames yields one complete frame per chunk, never a batch
     return Response(generate_frames(),
-                    mimetype='multipart/x-mixed-replace; boundary=frame')
+                    mimetype='multipart/x-mixed-replace; boundary=frame',
+                    headers=LIVE_STREAM_HEADERS)
+
+@app.route('/stream.h264')
+def stream_h264():
+    """Raw H.264 streaming endpoint (lower bandwidth than /stream, for players that decode H.264)."""
+    if not h264_enabled:
+        return ojsonify({"status": "error", "message": "H.264 stream not available."}), 503
+    return Response(generate_h264(), mimetype='video/h264', headers=LIVE_STREAM_HEADERS)
 
 # ==========================
 # Run Server and Cleanup
 # ==========================
+# Every open /stream, /stream.h264 and /sensors/stream connection holds a waitress
+# worker thread for as long as it is open, so leave room for a few dashboards.
+SERVER_THREADS = 16
+# Long idle timeout so waitress doesn't drop the long-lived streaming responses
+SERVER_CHANNEL_TIMEOUT = 3600 # seconds
+
+def cleanup():
+    """Ensure resources are closed gracefully."""
+    if picam2:
+        print("Stopping PiCamera2...")
+        picam2.stop_recording()
+    if i2c_bus:
+        print("Closing I2C bus...")
+        i2c_bus.close()
+    print("Server shutdown complete.")
+
 if __name__ == '__main__':
-    try:
-        print("Starting Flask server...")
-        app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)
-    finally:
-        # Ensure resources are closed gracefully
-        if picam2:
-            print("Stopping PiCamera2...")
-            picam2.stop()
-        if i2c_bus:
-            print("Closing I2C bus...")
-            i2c_bus.close()
-        print("Server shutdown complete.")
+    # Run cleanup on normal exit, CTRL+C, and SIGTERM (turned into a normal exit)
+    atexit.register(cleanup)
+    signal.signal(signal.SIGTERM, lambda sig, frame: sys.exit(0))
+
+    print("Starting waitress server...")
+    serve(app, host='0.0.0.0', port=5000, threads=SERVER_THREADS, channel_timeout=SERVER_CHANNEL_TIMEOUT)
@@ -0,0 +1,85 @@
+// Every sensor value shown on the dashboard
+const SENSOR_IDS = ['accel_x', 'accel_y', 'accel_z', 'current', 'voltage', 'power'];
+
+// Retry delay for the initial /sensors fetch, doubled after each failure
+const RETRY_DELAY_MIN_MS = 500;
+const RETRY_DELAY_MAX_MS = 10000;
+let retryDelayMs = RETRY_DELAY_MIN_MS;
+let haveLiveData = false;
+
+// One shared formatter, the text node inside each value <span> (looked up once on
+// load), and the text last written to it so unchanged values don't touch the DOM
+const numberFormat = new Intl.NumberFormat('en-US', { maximumFractionDigits: 3, useGrouping: false });
+const sensorNodes = {};
+const lastShown = {};
+
+function setSensorText(id, text) {
+    if (lastShown[id] !== text) {
+        lastShown[id] = text;
+        sensorNodes[id].nodeValue = text;
+    }
+}
+
+function showSensors(data) {
+    // Update Accelerometer
+    setSensorText('accel_x', numberFormat.format(data.accel.x) + ' g');
+    setSensorText('accel_y', numberFormat.format(data.accel.y) + ' g');
+    setSensorText('accel_z', numberFormat.format(data.accel.z) + ' g');
+
+    // Update Current Sensor
+    setSensorText('current', numberFormat.format(data.current_sensor.current) + ' mA');
+    setSensorText('voltage', numberFormat.format(data.current_sensor.voltage) + ' V');
+    setSensorText('power', numberFormat.format(data.current_sensor.power) + ' mW');
+}
+
+function showSensorError() {
+    // Display error messages
+    for (const id of SENSOR_IDS) {
+        setSensorText(id, 'Error');
+    }
+}
+
+async function updateSensors() {
+    // The live stream already delivered data, no need to keep retrying
+    if (haveLiveData) {
+        return;
+    }
+    try {
+        // 'no-cache' always asks the server, but sends the cached ETag so an unchanged
+        // reading comes back as an empty 304 over the page's existing keep-alive connection
+        const response = await fetch('/sensors', { cache: 'no-cache' });
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}`);
+        }
+        showSensors(await response.json());
+        retryDelayMs = RETRY_DELAY_MIN_MS;
+
+    } catch (err) {
+        console.error("Failed to fetch sensor data:", err);
+        showSensorError();
+        // Back off exponentially so a dead server isn't hammered
+        setTimeout(updateSensors, retryDelayMs);
+        retryDelayMs = Math.min(retryDelayMs * 2, RETRY_DELAY_MAX_MS);
+    }
+}
+
+window.onload = () => {
+    for (const id of SENSOR_IDS) {
+        sensorNodes[id] = document.getElementById(id).firstChild;
+    }
+
+    // Initial load (first paint before the first pushed sample)
+    updateSensors();
+
+    // Live updates: the server pushes each new sample over Server-Sent Events
+    const sensorStream = new EventSource('/sensors/stream');
+    sensorStream.onmessage = (e) => {
+        haveLiveData = true;
+        showSensors(JSON.parse(e.data));
+    };
+    sensorStream.onerror = (err) => {
+        // The browser reconnects on its own; show the values are stale until it does
+        console.error("Sensor stream error (browser will reconnect):", err);
+        showSensorError();
+    };
+};